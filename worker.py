@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+Persistent conversion worker for the EPUB to PDF batch converter.
+
+Run under calibre-debug so Calibre's conversion stack (Python + Qt) is
+imported once per worker process instead of once per converted file:
+
+    calibre-debug -e worker.py
+
+The worker reads one JSON job per line from stdin:
+
+    {"in": "/path/book.epub", "out": "/path/book.pdf", "opts": {...}}
+
+and writes one JSON result per line to stdout:
+
+    {"ok": true, "t": 1.23}
+    {"ok": false, "error": "..."}
+
+It exits when stdin is closed.
+"""
+
+import json
+import sys
+import time
+
+
+def convert(job):
+    """
+    Convert a single job dict using Calibre's conversion plumber.
+
+    Args:
+        job (dict): Job with "in", "out" and optional "opts" keys
+
+    Returns:
+        dict: Result with "ok" and either "t" (seconds) or "error"
+    """
+    start = time.time()
+    try:
+        from calibre.customize.conversion import OptionRecommendation
+        from calibre.ebooks.conversion.plumber import Plumber
+        from calibre.utils.logging import Log
+
+        log = Log()
+        log.outputs = []  # silence per-file conversion chatter
+
+        plumber = Plumber(job["in"], job["out"], log)
+        recommendations = [
+            (name.replace("-", "_"), value, OptionRecommendation.HIGH)
+            for name, value in (job.get("opts") or {}).items()
+        ]
+        plumber.merge_ui_recommendations(recommendations)
+        plumber.run()
+        return {"ok": True, "t": round(time.time() - start, 3)}
+    except Exception as e:
+        return {"ok": False, "error": str(e)}
+
+
+def main():
+    for line in sys.stdin:
+        line = line.strip()
+        if not line:
+            continue
+        result = convert(json.loads(line))
+        sys.stdout.write(json.dumps(result) + "\n")
+        sys.stdout.flush()
+
+
+if __name__ == "__main__":
+    main()